@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 
 from pydantic import FilePath
 
-from src.config import config
+from src.config import get_config
 from src.factories import SCISCRAPERS
 
 if TYPE_CHECKING:
@@ -26,6 +26,7 @@ def build_parser(argv: Sequence[str] | None) -> Namespace:
     Returns:
         Namespace: parsed arguments.
     """
+    config = get_config()
     parser = ArgumentParser(
         prog=config.prog,
         usage="%(prog)s [options] filepath",
@@ -8,16 +8,21 @@ Returns
 
 from __future__ import annotations
 
-import json
+import os
 from dataclasses import dataclass, field
 from datetime import date
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
-import numpy as np
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    import json as _json  # type: ignore[no-redef]
 
 FilePath = str | Path
 UTF = "utf-8"
+CONFIG_FILE = "config_setup.json"
 
 
 @dataclass
@@ -62,6 +67,18 @@ class ScrapeConfig:
         bycatch, i.e. words that suggest the Doc is not a match.
     sleep_interval : float
         The default time between web requests.
+    max_workers : int
+        How many web requests, or .pdf scrapes, may be in flight at once.
+    pdf_backend : str
+        The library `DocScraper` extracts .pdf text with, either
+        "pdfplumber" (the default) or the faster "pymupdf".
+    use_cache : bool
+        Whether scrape results are stored in, and reused from,
+        the ".sciscrape_cache" directory within `export_dir`.
+    cache_expiry_days : float
+        How long a cached web scrape result is reused before the paper
+        or author is looked up again, since citation counts and
+        reference lists change over time.
 
     """
 
@@ -82,6 +99,10 @@ class ScrapeConfig:
     sleep_interval: float
     profiling_path: str
     priority_keys: list = field(default_factory=list)
+    max_workers: int = 4
+    pdf_backend: str = "pdfplumber"
+    use_cache: bool = True
+    cache_expiry_days: float = 30.0
     today: str = date.today().strftime("%y%m%d")
 
 
@@ -99,14 +120,26 @@ def read_config(config_file: str) -> ScrapeConfig:
     ScrapeConfig
         A dataclass containing the overall configurations
     """
-    with open(config_file, encoding=UTF) as file:
-        data = json.load(file)
+    data = _json.loads(Path(config_file).read_bytes())
     return ScrapeConfig(**data)
 
 
-config: ScrapeConfig = read_config("config_setup.json")
+@cache
+def get_config() -> ScrapeConfig:
+    """
+    Reads the configs on first use and returns the cached ScrapeConfig.
+    The file is `config_setup.json`, unless another is named by the
+    `SCISCRAPER_CONFIG` environment variable.
+
+    Returns
+    -------
+    ScrapeConfig
+        A dataclass containing the overall configurations
+    """
+    return read_config(os.environ.get("SCISCRAPER_CONFIG", CONFIG_FILE))
+
 
-SEMANTIC_SCHOLAR_MAPPING: dict[str, str] = {
+SEMANTIC_SCHOLAR_MAPPING: Final[dict[str, str]] = {
     "title": "title",
     "pub_date": "publicationDate",
     "doi": "externalIds",
@@ -118,16 +151,16 @@ SEMANTIC_SCHOLAR_MAPPING: dict[str, str] = {
     "abstract": "abstract",
 }
 
-KEY_TYPE_PAIRINGS: dict[str, Any] = {
+KEY_TYPE_PAIRINGS: Final[dict[str, Any]] = {
     "doi_from_pdf": "string",
     "title": "string",
     "doi": "string",
     "internal_id": "string",
-    "times_cited": np.int16,
-    "matching_terms": np.int16,
-    "bycatch_terms": np.int16,
-    "total_word_count": np.int16,
-    "wordscore": np.float16,
+    "times_cited": "Int32",
+    "matching_terms": "Int32",
+    "bycatch_terms": "Int32",
+    "total_word_count": "Int32",
+    "wordscore": "Float32",
     "abstract": "string",
     "biblio": "string",
     "journal_title": "string",
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import re
 from collections import Counter
+from collections.abc import Callable
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
+from functools import cached_property, wraps
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pdfplumber
 
 from src.config import UTF, FilePath
 from src.doifrompdf import doi_from_pdf
 from src.log import logger, log_debug
+from src.resultcache import read_cached_result, write_cached_result
 from src.scraperesults import DocumentResult
 
+if TYPE_CHECKING:
+    from pdfplumber.page import Page
+
 PAPER_STATISTIC = re.compile(r"\(.*\=.*\)")
+# Runs of Unicode letters and digits, excluding underscores, which may be
+# joined by single hyphens so that entries like "well-being" still match.
+WORD_TOKEN = re.compile(r"[^\W_]+(?:-[^\W_]+)*")
+RESULT_CACHE_VERSION = "3"
+PDF_BACKENDS = ("pdfplumber", "pymupdf")
 
 
 @dataclass(frozen=True)
@@ -34,7 +50,9 @@ class FreqDistAndCount:
 
 
 @log_debug
-def match_terms(target: list[str], word_set: set[str]) -> FreqDistAndCount:
+def match_terms(
+    target: list[str], word_set: AbstractSet[str]
+) -> FreqDistAndCount:
     """
     Calculates the relevance of the paper, or abstract, as a percentage.
 
@@ -63,12 +81,40 @@ def match_terms(target: list[str], word_set: set[str]) -> FreqDistAndCount:
     """
 
     matching_terms = Counter(
-        word for word in target if word in word_set
+        filter(word_set.__contains__, target)
     ).most_common(3)
-    term_count = sum(term[1] for term in matching_terms)
+    term_count = sum(count for _, count in matching_terms)
     return FreqDistAndCount(term_count, matching_terms)
 
 
+ScoreMethod = Callable[["DocScraper", str], DocumentResult]
+
+
+def cached_by_file(score: ScoreMethod) -> ScoreMethod:
+    """
+    Decorator that stores the results of `DocScraper.score` on disk,
+    one pickle per scraped .pdf, so that re-running over the same
+    directory skips parsing any file that hasn't changed.
+
+    A result is reused only while the .pdf's path, size and
+    modification time, and the contents of both wordlists, are the same.
+    """
+
+    @wraps(score)
+    def wrapper(self: DocScraper, search_text: str) -> DocumentResult:
+        cache_file = self.cache_file(search_text)
+        if cache_file is None:
+            return score(self, search_text)
+        cached: DocumentResult | None = read_cached_result(cache_file)
+        if cached is not None:
+            return cached
+        result = score(self, search_text)
+        write_cached_result(cache_file, result)
+        return result
+
+    return wrapper
+
+
 @dataclass
 class DocScraper:
     """
@@ -76,13 +122,48 @@ class DocScraper:
     From these, it generates an analysis of its relevance,
     according to provided target and bycatch words, in the form of
     a percentage grade called WordscoreCalculator.
+
+    If a `cache_dir` is given, the results for each .pdf are stored there
+    and reused on later runs; see `cached_by_file`.
+
+    The text of each .pdf is extracted with `pdf_backend`, one of
+    PDF_BACKENDS. "pymupdf" is several times faster than "pdfplumber",
+    but requires the optional `pymupdf` package.
     """
 
     target_words_file: FilePath
     bycatch_words_file: FilePath
     is_pdf: bool = True
+    cache_dir: FilePath | None = None
+    pdf_backend: str = "pdfplumber"
+
+    def __post_init__(self) -> None:
+        if self.pdf_backend not in PDF_BACKENDS:
+            raise ValueError(
+                f"Unknown pdf_backend={self.pdf_backend!r},"
+                f" expected one of {PDF_BACKENDS}."
+            )
+
+    @cached_property
+    def target_set(self) -> frozenset[str]:
+        """The target words, read once from `target_words_file`."""
+        return self.unpack_txt_files(self.target_words_file)
+
+    @cached_property
+    def bycatch_set(self) -> frozenset[str]:
+        """The bycatch words, read once from `bycatch_words_file`."""
+        return self.unpack_txt_files(self.bycatch_words_file)
+
+    def load_wordlists(self) -> None:
+        """Reads both wordlists now, rather than on first use, so that
+        copies of this scraper sent to other processes carry them."""
+        logger.debug(
+            "Loaded %d target words and %d bycatch words",
+            len(self.target_set),
+            len(self.bycatch_set),
+        )
 
-    def unpack_txt_files(self, txtfile: FilePath) -> set[str]:
+    def unpack_txt_files(self, txtfile: FilePath) -> frozenset[str]:
         """
         Opens a .txt file containing the words that will analyze
         the ensuing passage, and creates a set with those words.
@@ -91,13 +172,93 @@ class DocScraper:
             txtfiles(FilePath): The filepath to the .txt file containing the words that
             will analyze the document.
 
+        Each entry is tokenized just as the text is, by `format_manuscript`.
+        Entries that come out as several words, such as phrases, could never
+        match a single word of the text, so they are skipped with a warning.
+
+        Returns:
+            frozenset[str]: A set of words against which the text will be compared.
+        """
+        lines = Path(txtfile).read_text(encoding=UTF).splitlines()
+        words: set[str] = set()
+        unmatchable: list[str] = []
+        for line in lines:
+            tokens = self.format_manuscript(line)
+            if len(tokens) == 1:
+                words.add(tokens[0])
+            elif tokens:
+                unmatchable.append(line.strip())
+        if unmatchable:
+            logger.warning(
+                "Skipping entries in txtfile=%s that are not single words: %s",
+                txtfile,
+                unmatchable,
+            )
+        return frozenset(words)
+
+    @cached_property
+    def wordlists_digest(self) -> str:
+        """A digest of both wordlists, so that editing either of them
+        invalidates any cached results."""
+        digest = hashlib.sha256()
+        for word_set in (self.target_set, self.bycatch_set):
+            digest.update("\n".join(sorted(word_set)).encode(UTF))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def cache_file(self, search_text: FilePath) -> Path | None:
+        """
+        Returns where the result for the .pdf at `search_text` is cached,
+        or None if results aren't being cached.
+
+        Parameters:
+            search_text(FilePath): The filepath to the .pdf.
+
+        Returns:
+            Path | None: The path of the cached result, whether or not it exists yet.
+        """
+        if not (self.is_pdf and self.cache_dir):
+            return None
+        pdf_path = Path(search_text).resolve()
+        stat = pdf_path.stat()
+        key = "|".join(
+            (
+                RESULT_CACHE_VERSION,
+                self.pdf_backend,
+                str(pdf_path),
+                str(stat.st_size),
+                str(stat.st_mtime_ns),
+                self.wordlists_digest,
+            )
+        )
+        filename = hashlib.sha256(key.encode(UTF)).hexdigest()
+        return Path(self.cache_dir) / f"{filename}.pickle"
+
+    def has_cached_result(self, search_text: FilePath) -> bool:
+        """Whether the result for the .pdf at `search_text` is already
+        cached, in which case the .pdf itself won't be read."""
+        try:
+            cache_file = self.cache_file(search_text)
+        except OSError:
+            return False
+        return cache_file is not None and cache_file.exists()
+
+    def obtain(self, search_text: str) -> list[DocumentResult]:
+        """
+        Scores the pdf or abstract provided for relevance; see `score`.
+
+        Parameters:
+            search_text(str) : The initially provided search string from
+                a prior list comprehension, often in the form of either a filepath or the abstract of a paper.
+
         Returns:
-            set[str]: A set of words against which the text will be compared.
+            list[DocumentResult] : A list of the one resulting DocumentResult, which is
+            sent back to a dataframe.
         """
-        with open(txtfile, encoding=UTF) as iowrapper:
-            return {word.strip().lower() for word in iowrapper}
+        return [self.score(search_text)]
 
-    def obtain(self, search_text: str) -> DocumentResult | None:
+    @cached_by_file
+    def score(self, search_text: str) -> DocumentResult:
         """
         Given the provided search string, it extracts the text from
         the pdf or abstract provided, it cleans the text in question,
@@ -109,11 +270,8 @@ class DocScraper:
                 a prior list comprehension, often in the form of either a filepath or the abstract of a paper.
 
         Returns:
-            DocumentResult | None : It either returns a formatted DocumentResult dataclass, which is
-            sent back to a dataframe, or it returns None.
+            DocumentResult : A formatted DocumentResult dataclass.
         """
-        target_set = self.unpack_txt_files(self.target_words_file)
-        bycatch_set = self.unpack_txt_files(self.bycatch_words_file)
         preprint: str = (
             self.extract_text_from_pdf(search_text)
             if self.is_pdf
@@ -121,8 +279,8 @@ class DocScraper:
         )
         digital_object_identifier = doi_from_pdf(search_text, preprint).identifier if self.is_pdf else "N/A"  # type: ignore[arg-type, union-attr]
         token_list: list[str] = self.format_manuscript(preprint)
-        target = match_terms(token_list, target_set)
-        bycatch = match_terms(token_list, bycatch_set)
+        target = match_terms(token_list, self.target_set)
+        bycatch = match_terms(token_list, self.bycatch_set)
         total_word_count = len(token_list)
         wordscore: float = calculate_likelihood(
             total_word_count,
@@ -144,13 +302,15 @@ class DocScraper:
     def format_manuscript(self, preprint: str) -> list[str]:
         """
         This function takes a preprint string and returns a list of words after cleaning the text.
+        The text is lowercased and tokenized in a single regex pass, which also drops
+        punctuation and line breaks.
 
         :param str preprint: The preprint text to be cleaned.
 
         :rtype list:
         :return: A list of words after cleaning the text.
         """
-        return preprint.strip().lower().split(" ")
+        return WORD_TOKEN.findall(preprint.lower())
 
     def extract_text_from_pdf(self, pdf_path: FilePath) -> str:
         """
@@ -163,12 +323,80 @@ class DocScraper:
         :rtype str:
         :return: A string of unformatted words from the entire document.
         """
-        with pdfplumber.open(pdf_path) as pdf:
-            text_pages = [
-                page.extract_text(x_tolerance=1, y_tolerance=3)
-                for page in pdf.pages
-            ]
-        return " ".join(text_pages)
+        if self.pdf_backend == "pymupdf":
+            return self.extract_text_with_pymupdf(pdf_path)
+        with open(pdf_path, "rb") as file:
+            advise_sequential_read(file.fileno())
+            with pdfplumber.open(file) as pdf:
+                return " ".join(map(self.extract_text_from_page, pdf.pages))
+
+    @staticmethod
+    def extract_text_with_pymupdf(pdf_path: FilePath) -> str:
+        """
+        Extracts the text of the .pdf with PyMuPDF, whose compiled
+        text extraction skips the layout analysis that pdfplumber does.
+
+        :param FilePath pdf_path: The filepath to the .pdf.
+
+        :rtype str:
+        :return: A string of unformatted words from the entire document.
+        """
+        import pymupdf  # optional dependency, see the `pymupdf` extra
+
+        with pymupdf.open(pdf_path) as document:
+            return " ".join(page.get_text("text") for page in document)
+
+    @staticmethod
+    def extract_text_from_page(page: Page) -> str:
+        """
+        Extracts the text from a single page, then flushes the page's
+        cached layout objects so that only one page's worth is held
+        in memory at a time.
+
+        :param Page page: A page of an open pdfplumber document.
+
+        :rtype str:
+        :return: The unformatted text of the page, or an empty string.
+        """
+        text: str = page.extract_text(x_tolerance=1, y_tolerance=3) or ""
+        page.flush_cache()
+        return text
+
+
+def advise_sequential_read(fd: int) -> None:
+    """
+    Tells the kernel that the open file `fd` will be read front to back,
+    which enlarges its readahead window on cold reads.
+    The advice applies to this open file only, and is skipped
+    on platforms without `posix_fadvise`.
+
+    :param int fd: The file descriptor of an open .pdf file.
+    """
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError) as e:
+        logger.debug("Skipping posix_fadvise for fd=%s: %s", fd, e)
+
+
+def prefetch_file(path: FilePath) -> None:
+    """
+    Asks the kernel to start reading the file at `path` into the page
+    cache in the background, so a later read doesn't wait on the disk.
+    Missing files and platforms without `posix_fadvise` are skipped.
+
+    :param FilePath path: The filepath to a file that will be read soon.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError as e:
+        logger.debug("Skipping prefetch of path=%s: %s", path, e)
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except (AttributeError, OSError) as e:
+        logger.debug("Skipping posix_fadvise for path=%s: %s", path, e)
+    finally:
+        os.close(fd)
 
 
 def calculate_likelihood(
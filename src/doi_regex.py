@@ -15,7 +15,6 @@ ARXIV_PATTERNS = [
     re.compile(r"^(\d{4}\.\d+)(?:v\d+)?$"),
     re.compile(r"arxiv[\s]*\:[\s]*(\d{4}\.\d+)(?:v\d+)?(?:[\s\n\"<]|$)"),
     re.compile(r"(\d{4}\.\d+)(?:v\d+)?(?:\.pdf)"),
-    re.compile(r"^(\d{4}\.\d+)(?:v\d+)?$"),
 ]
 
 DOI_REGEX = re.compile(
@@ -10,7 +10,7 @@ from feedparser import (
 )  # type: ignore[import-untyped, unused-ignore]
 from googlesearch import search  # type: ignore[import-untyped, unused-ignore]
 
-from src.config import FilePath, config
+from src.config import FilePath, get_config
 from src.doi_regex import IDENTIFIER_PATTERNS, extract_identifier
 from src.log import logger
 from src.scraperesults import DOIFromPDFResult
@@ -59,7 +59,7 @@ def find_identifier_in_metadata(
         "Method #1: Looking for a valid identifier in the document metadata..."
     )
 
-    for key in config.priority_keys:
+    for key in get_config().priority_keys:
         if not (initial_result := metadata.get(key)):
             continue
         logger.info(f"Identifier found using Method #1 {initial_result}")
@@ -8,14 +8,11 @@ import random
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from tempfile import TemporaryFile
-from time import sleep
 from typing import TYPE_CHECKING
 
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser
 
-from src.change_dir import change_dir
-from src.config import FilePath, config
+from src.config import FilePath, get_config
 from src.log import log_debug, logger
 from src.scraperesults import DownloadReceipt
 from src.webscrapers import make_request, client
@@ -27,6 +24,7 @@ if TYPE_CHECKING:
 LINK_CLEANING_PATTERN = re.compile(
     r"(?P<location>location\.href=\')(?P<sep>/+)?"
 )
+DOWNLOAD_BUTTON_SELECTOR = "#buttons button:nth-child(1)"
 
 
 def create_document(
@@ -34,27 +32,25 @@ def create_document(
     contents: bytes,
 ) -> None:
     """
-    `create_document` goes to, and downloads, the isolated download link.
-    It is sent as bytes to a temporary text file.
-    The temporary text file is then used as a basis to generate a new pdf.
-    Afterwards, the temporary text file is deleted
-    in preparation for the next pdf.
+    `create_document` writes the downloaded contents to `filename`,
+    within the configured export directory.
+    The path is joined rather than changed into, since downloads can run
+    on several threads at once and the working directory is process-wide.
 
     Parameters
     ----------
-    search_text : str
-        The initial term to be rendered in the filename.
-    link : str
-        The link to be followed.
+    filename : FilePath
+        The name of the file to be written.
+    contents : bytes
+        The downloaded contents of the file.
 
     Returns
     -------
         A .pdf or .png file, depending on the `Downloader` in use.
     """
-    with change_dir(config.export_dir), TemporaryFile() as temp:
-        temp.write(contents)
-        with open(filename, "wb") as file:
-            file.writelines(temp)
+    export_dir = Path(get_config().export_dir)
+    export_dir.mkdir(parents=True, exist_ok=True)
+    (export_dir / filename).write_bytes(contents)
 
 
 @dataclass
@@ -75,14 +71,33 @@ class BulkPDFScraper:
     url: str
     link_cleaning_pattern: re.Pattern[str] = LINK_CLEANING_PATTERN
     cls_name: str = field(init=False)
-    export_dir: FilePath = Path(config.export_dir)
+    export_dir: FilePath = field(
+        default_factory=lambda: Path(get_config().export_dir)
+    )
 
     def __post_init__(self) -> None:
         self.cls_name = type(self).__name__
 
-    def obtain(self, search_text: str) -> DownloadReceipt:
+    def obtain(self, search_text: str) -> list[DownloadReceipt]:
         """
-        `obtain` submits a payload, as acquired from
+        Downloads the paper in question; see `download`.
+
+        Parameters
+        ----------
+        search_text : str
+            the pubid or digital object identifier
+            (DOI) of the paper in question.
+
+        Returns
+        -------
+        list[DownloadReceipt]
+            A list of the one resulting receipt.
+        """
+        return [self.download(search_text)]
+
+    def download(self, search_text: str) -> DownloadReceipt:
+        """
+        `download` submits a payload, as acquired from
         the prior search terms, to the specified downloader website.
         If the request is successful, it isolates the link
         to download as a link of its own, and makes that request.
@@ -106,14 +121,16 @@ class BulkPDFScraper:
             if so, where the ensuing .pdf may be found.
         """
         payload = {"request": search_text}
-        paper_title = Path(f"{config.today}_{search_text.replace('/','')}.pdf")
-        response_text = make_request(
+        paper_title = Path(
+            f"{get_config().today}_{search_text.replace('/','')}.pdf"
+        )
+        response = make_request(
             url=self.url,
             method="POST",
-            payload=payload,
+            data=payload,
         )
 
-        download_link: str | None = self.find_download_link(response_text)
+        download_link: str | None = self.find_download_link(response.content)
         formatted_src: str | None = self.format_download_link(download_link)
         return (
             self.download_paper(paper_title, formatted_src)
@@ -133,27 +150,28 @@ class BulkPDFScraper:
         )
 
     @log_debug
-    def find_download_link(self, search_text: str | None) -> str | None:
+    def find_download_link(self, page: bytes | str | None) -> str | None:
         """
-        create_querystring, within `BulkPDFScraper`,
+        find_download_link, within `BulkPDFScraper`,
         returns a link that will download the paper in question.
 
         Parameters
         ---------
-        resp_text : text
-            A prior Response's text, as HTML, to be parsed.
+        page : bytes | str
+            A prior Response's content, as HTML, to be parsed.
+            Raw bytes are parsed as they are, without decoding them first.
 
         Return
         -----
         str
             A download link, which will download a link to the paper.
         """
-        if not isinstance(search_text, str):
+        if not page:
             return None
-        html = HTMLParser(search_text)
+        html = LexborHTMLParser(page)
         try:
             download_link: str | None = html.css_first(
-                "#buttons button:nth-child(1)"
+                DOWNLOAD_BUTTON_SELECTOR
             ).attributes["onclick"]
             return download_link
         except (AttributeError, ValueError) as e:
@@ -232,8 +250,20 @@ class ImagesDownloader:
     def __post_init__(self) -> None:
         self.cls_name = type(self).__name__
 
+    def obtain(self, search_text: str) -> list[DownloadReceipt]:
+        """
+        Downloads the image at the given link; see `download`.
+
+        Parameters:
+        search_text (str): The search text to query the downloader website with.
+
+        Returns:
+        list[DownloadReceipt]: A list of the one resulting receipt.
+        """
+        return [self.download(search_text)]
+
     @log_debug
-    def obtain(self, search_text: str) -> DownloadReceipt | None:
+    def download(self, search_text: str) -> DownloadReceipt:
         """
         Queries the downloader website with the given search text,
         and attempts to download the image associated with the search text.
@@ -245,7 +275,6 @@ class ImagesDownloader:
         DownloadReceipt: A receipt indicating whether the image was successfully
         downloaded and the path to the downloaded image.
         """
-        sleep(1.0)
         search_ext = search_text.split(".")[-1]
         response = make_request(search_text, stream=True, allow_redirects=True)
 
@@ -298,6 +327,6 @@ class ImagesDownloader:
 
         file_id = random.randint(1, 255)
         etag = (etag or "_NaN_").strip('"')
-        filename = Path(f"{config.today}_{etag}_{file_id}.{ext}")
+        filename = Path(f"{get_config().today}_{etag}_{file_id}.{ext}")
         logger.debug("filename=%s", filename)
         return filename
@@ -10,7 +10,7 @@ from __future__ import annotations
 from functools import partial
 from pathlib import Path
 
-from src.config import config
+from src.config import get_config
 from src.docscraper import DocScraper
 from src.downloaders import BulkPDFScraper, ImagesDownloader
 from src.fetch import SciScraper, ScrapeFetcher, StagingFetcher
@@ -28,25 +28,34 @@ from src.webscrapers import (
     SemanticWebScraper,
 )
 
+CACHE_DIR = (
+    Path(get_config().export_dir) / ".sciscrape_cache"
+    if get_config().use_cache
+    else None
+)
+
 
 class Scraper:
     pdf_lookup = ScrapeFetcher(
         DocScraper(
-            Path(config.target_words).resolve(),
-            Path(config.bycatch_words).resolve(),
+            Path(get_config().target_words).resolve(),
+            Path(get_config().bycatch_words).resolve(),
+            cache_dir=CACHE_DIR,
+            pdf_backend=get_config().pdf_backend,
         ),
         serialize_from_directory,
     )
     csv_lookup = ScrapeFetcher(
         SemanticWebScraper(
-            config.semantic_scholar_url,
+            get_config().semantic_scholar_url,
+            cache_dir=CACHE_DIR,
         ),
         serialize_from_csv,
     )
     abstract_lookup = ScrapeFetcher(
         DocScraper(
-            Path(config.target_words).resolve(),
-            Path(config.bycatch_words).resolve(),
+            Path(get_config().target_words).resolve(),
+            Path(get_config().bycatch_words).resolve(),
             is_pdf=False,
         ),
         partial(
@@ -63,15 +72,16 @@ class Scraper:
 class Stager:
     abstracts = StagingFetcher(
         DocScraper(
-            Path(config.target_words).resolve(),
-            Path(config.bycatch_words).resolve(),
+            Path(get_config().target_words).resolve(),
+            Path(get_config().bycatch_words).resolve(),
             False,
         ),
         stage_from_series,
     )
     authors = StagingFetcher(
         ORCHIDScraper(
-            config.orcid_url,
+            get_config().orcid_url,
+            cache_dir=CACHE_DIR,
         ),
         partial(
             stage_with_reference,
@@ -80,12 +90,13 @@ class Stager:
     )
     citations = StagingFetcher(
         SemanticWebScraper(
-            config.semantic_scholar_url,
+            get_config().semantic_scholar_url,
+            cache_dir=CACHE_DIR,
         ),
         stage_with_reference,
     )
     download = StagingFetcher(
-        BulkPDFScraper(config.downloader_url),
+        BulkPDFScraper(get_config().downloader_url),
         partial(stage_from_series, column="doi"),
     )
     images = StagingFetcher(
@@ -94,13 +105,15 @@ class Stager:
     )
     pdf_expanded = StagingFetcher(
         SemanticWebScraper(
-            config.semantic_scholar_url,
+            get_config().semantic_scholar_url,
+            cache_dir=CACHE_DIR,
         ),
         partial(stage_from_series, column="doi_from_pdf"),
     )
     references = StagingFetcher(
         SemanticWebScraper(
-            config.semantic_scholar_url,
+            get_config().semantic_scholar_url,
+            cache_dir=CACHE_DIR,
         ),
         partial(stage_with_reference, column_x="references"),
     )
@@ -4,30 +4,127 @@ returning various dataframes for each"""
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass, field, fields
+from functools import cache, partial
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Generator, Protocol
 
 import pandas as pd
 from tqdm import tqdm
 
-from src.config import KEY_TYPE_PAIRINGS, FilePath, config
-from src.docscraper import DocScraper
-from src.downloaders import BulkPDFScraper, ImagesDownloader
+from src.config import KEY_TYPE_PAIRINGS, FilePath, get_config
+from src.docscraper import DocScraper, prefetch_file
 from src.log import logger
 from src.scraperesults import ScrapeResult
-from src.webscrapers import ORCHIDScraper, SemanticWebScraper
+
+PREFETCH_DEPTH = 2
 
 SerializationStrategyFunction = Callable[[Path], list[Any]]
 StagingStrategyFunction = Callable[[pd.DataFrame], Iterable[Any]]
-Scraper = (
-    DocScraper
-    | BulkPDFScraper
-    | ImagesDownloader
-    | SemanticWebScraper
-    | ORCHIDScraper
-)
+
+
+class Scraper(Protocol):
+    """
+    Scraper describes what `Fetcher` needs of a scraper:
+    an `obtain` method that turns one search term into
+    zero or more results.
+    """
+
+    def obtain(self, search_text: str) -> Iterable[ScrapeResult]: ...
+
+
+def obtain_eagerly(scraper: Scraper, search_text: str) -> list[ScrapeResult]:
+    """
+    Runs `scraper.obtain` to completion, so that a scraper whose results
+    are generated lazily still does its work inside the worker.
+    """
+    return list(scraper.obtain(search_text))
+
+
+_worker_scraper: Scraper | None = None
+
+
+def install_worker_scraper(scraper: Scraper) -> None:
+    """
+    Process pool initializer: keeps the scraper in the worker,
+    so that it is unpickled once per worker rather than once per task.
+    """
+    global _worker_scraper
+    _worker_scraper = scraper
+
+
+def obtain_in_worker(search_text: str) -> list[ScrapeResult]:
+    """Runs the scraper installed by `install_worker_scraper`."""
+    assert _worker_scraper is not None
+    return obtain_eagerly(_worker_scraper, search_text)
+
+
+@cache
+def result_fields(cls: type[ScrapeResult]) -> tuple[str, ...]:
+    """Returns the field names of a ScrapeResult dataclass, in order."""
+    return tuple(result_field.name for result_field in fields(cls))
+
+
+def results_to_dataframe(results: Iterable[ScrapeResult]) -> pd.DataFrame:
+    """
+    Builds a dataframe from scrape results as they are fetched, one row
+    per result. Each field is appended to a column buffer of its own,
+    so the results themselves are never held in a list.
+    The columns in KEY_TYPE_PAIRINGS are given their dtypes as they are
+    wrapped, rather than inferred and then cast again.
+
+    Parameters
+    ----------
+    results : Iterable[ScrapeResult]
+        The results from a single scraper, often a `fetch` generator.
+
+    Returns
+    -------
+    pd.DataFrame
+        A dataframe with one column per field of the results.
+    """
+    results = iter(results)
+    first = next(results, None)
+    if first is None:
+        return pd.DataFrame()
+    columns = result_fields(type(first))
+    get_row = attrgetter(*columns)
+    buffers: dict[str, list[Any]] = {column: [] for column in columns}
+    appenders = [buffers[column].append for column in columns]
+    for result in chain((first,), results):
+        for append, value in zip(appenders, get_row(result)):
+            append(value)
+    return pd.DataFrame(
+        {
+            column: as_column(column, buffer)
+            for column, buffer in buffers.items()
+        },
+        copy=False,
+    )
+
+
+def as_column(column: str, values: list[Any]) -> Any:
+    """Wraps a column buffer in an array of its KEY_TYPE_PAIRINGS dtype,
+    or returns the buffer as is if the column has none.
+    Numeric values are filled directly into a nullable pandas array;
+    "string" columns are converted from an object series, which also
+    handles list-like values."""
+    dtype = KEY_TYPE_PAIRINGS.get(column)
+    if dtype is None:
+        return values
+    if dtype == "string":
+        return pd.Series(values, dtype=object).astype(dtype)
+    return pd.array(values, dtype=dtype)
 
 
 @dataclass
@@ -35,9 +132,18 @@ class Fetcher(ABC):
     """
     Fetcher is the overarching abstract class for fetching data
     from a given query.
+
+    PDF scrapes are CPU-bound and independent of one another, so they are
+    spread across a pool of `max_workers` processes. Web scrapes and
+    downloads are I/O-bound, so they run on a pool of `max_workers`
+    threads, while `make_request` keeps the requests themselves spaced
+    out to respect each site's rate limits. Either pool defaults to the
+    configured `max_workers`, since scoring a PDF may itself look up
+    its DOI online.
     """
 
     scraper: Scraper
+    max_workers: int | None = field(default=None, kw_only=True)
 
     @abstractmethod
     def __call__(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
@@ -72,14 +178,88 @@ class Fetcher(ABC):
         ScrapeResult
             A result containing bibliographic data.
         """
-        for term in tqdm(
-            search_terms, desc="[sciscraper]: ", unit=f"{tqdm_unit}"
+        for results in tqdm(
+            self.obtain_all(search_terms),
+            total=len(search_terms),
+            desc="[sciscraper]: ",
+            unit=f"{tqdm_unit}",
         ):
-            results = self.scraper.obtain(term)
-            if isinstance(results, Generator):
-                yield from results
-            elif results is not None:
-                yield results
+            yield from results
+
+    def obtain_all(
+        self, search_terms: list[str]
+    ) -> Iterator[Iterable[ScrapeResult]]:
+        """
+        obtain_all calls the scraper on each search term, in order.
+        PDF scrapes are dispatched to a process pool, and web scrapes
+        to a thread pool, so that their round trips overlap; scrapes of
+        anything else run serially in the current process.
+
+        Only PREFETCH_DEPTH more terms than there are workers are queued
+        at once. Each queued PDF is prefetched into the page cache,
+        so that it is read from disk while earlier ones are parsed,
+        unless its result is already cached and it won't be read at all.
+        """
+        workers = self.max_workers or get_config().max_workers
+        if self.runs_in_processes:
+            # Read the wordlists once here, so that the scraper each
+            # worker receives already carries them.
+            if isinstance(self.scraper, DocScraper):
+                self.scraper.load_wordlists()
+            executor: Executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=install_worker_scraper,
+                initargs=(self.scraper,),
+            )
+            yield from self.obtain_concurrently(
+                search_terms, executor, workers, obtain_in_worker
+            )
+        elif self.runs_in_threads:
+            yield from self.obtain_concurrently(
+                search_terms,
+                ThreadPoolExecutor(max_workers=workers),
+                workers,
+                partial(obtain_eagerly, self.scraper),
+            )
+        else:
+            yield from map(self.scraper.obtain, search_terms)
+
+    def obtain_concurrently(
+        self,
+        search_terms: list[str],
+        executor: Executor,
+        workers: int,
+        task: Callable[[str], list[ScrapeResult]],
+    ) -> Iterator[Iterable[ScrapeResult]]:
+        """Submits each term to the executor, yielding results in order."""
+        pending: deque[Future[list[ScrapeResult]]] = deque()
+        with executor:
+            for term in search_terms:
+                if self.needs_prefetch(term):
+                    prefetch_file(term)
+                pending.append(executor.submit(task, term))
+                if len(pending) >= workers + PREFETCH_DEPTH:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    @property
+    def runs_in_processes(self) -> bool:
+        """Whether the scraper parses .pdf files, and so is CPU-bound."""
+        return isinstance(self.scraper, DocScraper) and self.scraper.is_pdf
+
+    def needs_prefetch(self, search_text: str) -> bool:
+        """Whether the .pdf at `search_text` will be parsed, and so read."""
+        return (
+            isinstance(self.scraper, DocScraper)
+            and self.scraper.is_pdf
+            and not self.scraper.has_cached_result(search_text)
+        )
+
+    @property
+    def runs_in_threads(self) -> bool:
+        """Whether the scraper makes web requests, and so is I/O-bound."""
+        return not isinstance(self.scraper, DocScraper)
 
 
 @dataclass
@@ -95,8 +275,7 @@ class ScrapeFetcher(Fetcher):
 
     def __call__(self, target: Path) -> pd.DataFrame:
         search_terms: list[str] = self.serializer(target)
-        results = list(self.fetch(search_terms))
-        dataframe = pd.DataFrame(results)
+        dataframe = results_to_dataframe(self.fetch(search_terms))
         if self.title_serializer:
             dataframe["title"] = self.title_serializer(target)
         return dataframe
@@ -127,8 +306,9 @@ class StagingFetcher(Fetcher):
         """If the terms are staged as a list, then the dataframe is extended
         along the provided query, and then it is appended to the existing dataframe.
         """
-        results = list(self.fetch(staged_terms))
-        dataframe_ext: pd.DataFrame = pd.DataFrame(results)
+        dataframe_ext: pd.DataFrame = results_to_dataframe(
+            self.fetch(staged_terms)
+        )
         return pd.concat(
             [prior_dataframe, dataframe_ext],
             axis=1,
@@ -148,8 +328,7 @@ class StagingFetcher(Fetcher):
         provide the source titles, from which the ensuing citations
         were originally found. The prior dataframe is not kept."""
         citations, src_titles = staged_terms
-        results = list(self.fetch(citations))
-        ref_dataframe = pd.DataFrame(results)
+        ref_dataframe = results_to_dataframe(self.fetch(citations))
         dataframe = ref_dataframe.join(
             pd.Series(
                 src_titles,
@@ -199,8 +378,15 @@ class SciScraper:
         self.logger.setLevel(10) if self.debug else self.logger.setLevel(20)
 
     def remove_empty_columns(self, dataframe: pd.DataFrame) -> pd.DataFrame:
-        """Removes all empty columns in the dataframe before exporting to .csv."""
-        return dataframe.replace("", float("NaN")).dropna(how="all", axis=1)
+        """Removes all empty columns in the dataframe before exporting to .csv.
+        A column is empty if every value is missing or an empty string.
+        Columns are checked one at a time, positionally, so that no
+        whole-frame mask is built and duplicate labels are kept."""
+        is_kept = [
+            not (column.isna() | column.eq("")).all()
+            for _, column in dataframe.items()
+        ]
+        return dataframe.loc[:, is_kept]
 
     @staticmethod
     def dataframe_casting(dataframe: pd.DataFrame) -> pd.DataFrame:
@@ -214,17 +400,21 @@ class SciScraper:
             A cleaned and optimized dataframe.
         """
 
-        # Convert "pub_date" column to datetime data type
-        if "pub_date" in dataframe:
-            dataframe["pub_date"] = SciScraper.downcast_available_datetimes(
-                dataframe
+        # Convert "pub_date" column to datetime data type. `assign` builds
+        # a new frame, since `dataframe` may be a selection of another.
+        if "pub_date" in dataframe.columns:
+            dataframe = dataframe.assign(
+                pub_date=SciScraper.downcast_available_datetimes(dataframe)
             )
 
-        # Convert columns in KEY_TYPE_PAIRINGS dictionary to specified data types
-        for scikey, value in KEY_TYPE_PAIRINGS.items():
-            if scikey in dataframe:
-                dataframe[scikey] = dataframe[scikey].astype(value)
-        return dataframe
+        # Convert columns in KEY_TYPE_PAIRINGS dictionary to specified data types,
+        # in one call. Columns built by `results_to_dataframe` already have them.
+        dtype_map = {
+            scikey: value
+            for scikey, value in KEY_TYPE_PAIRINGS.items()
+            if scikey in dataframe.columns
+        }
+        return dataframe.astype(dtype_map, copy=False)
 
     @staticmethod
     def downcast_available_datetimes(
@@ -236,10 +426,13 @@ class SciScraper:
     @staticmethod
     def export_sciscrape_results(
         dataframe: pd.DataFrame,
-        export_dir: FilePath = Path(config.export_dir),
+        export_dir: FilePath | None = None,
         max_backups: int = 3,
     ) -> None:
-        """Export data to the specified export directory."""
+        """Export data to the specified export directory,
+        which defaults to the configured `export_dir`."""
+        config = get_config()
+        export_dir = Path(export_dir or config.export_dir)
         SciScraper.dataframe_logging(dataframe)
         base_filename = Path(f"{config.today}_sciscraper.csv")
         export_path = export_dir / base_filename
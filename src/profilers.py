@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Callable, Any
 import memory_profiler
 import psutil
 
-from src.config import config
+from src.config import get_config
 from src.log import logger
 
 if TYPE_CHECKING:
@@ -58,13 +58,14 @@ def run_benchmark(args: Namespace, sciscrape: SciScraper) -> None:
     stats = pstats.Stats(pr)
     stats.sort_stats(pstats.SortKey.TIME)
     stats.print_stats()
-    stats.dump_stats(config.profiling_path)
+    profiling_path = get_config().profiling_path
+    stats.dump_stats(profiling_path)
     proc = subprocess.Popen(
         [
             sys.executable,
             "-m",
             "snakeviz",
-            config.profiling_path,
+            profiling_path,
         ],
         shell=True,
     )
@@ -0,0 +1,57 @@
+r"""Reads and writes scrape results cached on disk, one pickle per entry."""
+
+from __future__ import annotations
+
+import os
+import pickle
+
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from time import time
+from typing import Any
+
+from src.log import logger
+
+
+def read_cached_result(
+    cache_file: Path, max_age: float | None = None
+) -> Any | None:
+    """
+    Returns the result cached at `cache_file`,
+    or None if there isn't one, it can't be read,
+    or it was written more than `max_age` seconds ago.
+    """
+    try:
+        if (
+            max_age is not None
+            and time() - cache_file.stat().st_mtime > max_age
+        ):
+            return None
+        return pickle.loads(cache_file.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # A stale pickle can fail to load in many ways, e.g. when a class
+        # it refers to has since moved. Treat it as a miss and re-scrape.
+        logger.warning("Ignoring unreadable cache_file=%s: %r", cache_file, e)
+        return None
+
+
+def write_cached_result(cache_file: Path, result: Any) -> None:
+    """
+    Stores `result` at `cache_file`. The pickle is written to a temporary
+    file first and then moved into place, so that concurrent readers never
+    see a partially written entry. A failed write is logged and skipped,
+    since the result itself is still good.
+    """
+    temp_name = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(dir=cache_file.parent, delete=False) as temp:
+            temp_name = temp.name
+            temp.write(pickle.dumps(result))
+        os.replace(temp_name, cache_file)
+    except OSError as e:
+        logger.warning("Could not write cache_file=%s: %s", cache_file, e)
+        if temp_name is not None:
+            Path(temp_name).unlink(missing_ok=True)
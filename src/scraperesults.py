@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WebScrapeResult:
     """Represents a result from a scrape to be passed back to the dataframe."""
 
@@ -22,7 +22,7 @@ class WebScrapeResult:
     abstract: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentResult:
     """DocumentResult contains the WordscoreCalculator\
     scoring relevance, and two lists, each with\
@@ -40,7 +40,7 @@ class DocumentResult:
     paper_parentheticals: list[Any] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DownloadReceipt:
     """
     A representation of the receipt describing whether
@@ -63,7 +63,7 @@ class DownloadReceipt:
     filepath: str = "N/A"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DOIFromPDFResult:
     "A data class containing the extracted identifier, and its type."
 
@@ -1,24 +1,92 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
-from json import loads
-from time import sleep
-from typing import TYPE_CHECKING, Any, Optional
+from functools import cache, cached_property, wraps
+from operator import itemgetter
+from pathlib import Path
+from threading import Lock
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Any, Final, Optional
 from urllib.parse import quote_plus, urlencode
 
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from src.config import UTF, FilePath, get_config
 from src.log import logger
+from src.resultcache import read_cached_result, write_cached_result
 from src.scraperesults import WebScrapeResult
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore[no-redef]
+
 if TYPE_CHECKING:
     from collections.abc import Generator
 
 
+class RateLimiter:
+    """
+    RateLimiter spaces out web requests made from any number of threads.
+
+    Each call to `wait` reserves the next free start time, at least
+    `interval` seconds after the previous one, and sleeps until then.
+    The reservation happens under a lock but the sleep does not, so
+    waiting threads never hold each other up beyond their own slot.
+    """
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.next_slot = 0.0
+
+    def wait(self, interval: float) -> None:
+        with self.lock:
+            now = monotonic()
+            start = max(now, self.next_slot)
+            self.next_slot = start + interval
+        if start > now:
+            sleep(start - now)
+
+
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET", "POST"),
+    raise_on_status=False,
+)
+
 client = Session()
+rate_limiter = RateLimiter()
+
+
+@cache
+def mount_pooled_adapter(session: Session) -> Session:
+    """
+    Mounts a retrying adapter, with a connection pool sized to the
+    configured `max_workers`, onto `session`, once per session.
+    This happens on the first request rather than at import, so that
+    importing this module doesn't read the config.
+    """
+    pool_size = get_config().max_workers
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size * 2,
+        max_retries=RETRY_POLICY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class NotFoundError(ValueError):
+    """Raised when the server answers that what was asked for doesn't exist."""
 
 
 def make_request(
@@ -27,66 +95,169 @@ def make_request(
     sleep_val: float = 1.0,
     **kwargs,
 ) -> Response:
-    sleep(sleep_val)
-    response = client.request(method, url, **kwargs)
+    session = mount_pooled_adapter(client)
+    rate_limiter.wait(sleep_val)
+    response = session.request(method, url, **kwargs)
     logger.debug(
-        "response=%r, scraper=%r, status_code=%s",
+        "response=%r, status_code=%s",
         response,
         response.status_code,
     )
+    if response.status_code == 404:
+        raise NotFoundError("Response not found")
     if response.status_code != 200:
         raise ValueError("Response not found")
     return response
 
 
+RESULT_CACHE_VERSION = "2"
+DAY = 24 * 60 * 60
+NOT_FOUND_TTL = DAY
+
+get_title = itemgetter("title")
+
+SEMANTIC_SCHOLAR_FIELDS = (
+    "url,paperId,year,authors,externalIds,title,publicationDate,abstract,"
+    "citationCount,journal,fieldsOfStudy,citations,references"
+)
+
+ORCID_SEARCH_QUERY = (
+    '{!edismax qf="given-and-family-names^50.0 family-name^10.0 given-names^10.0 credit-name^10.0 other-names^5.0 text^1.0" pf="given-and-family-names^50.0" bq="current-institution-affiliation-name:[* TO *]^100.0 past-institution-affiliation-name:[* TO *]^70" mm=1}'
+)
+ORCID_SEARCH_QUERYSTRING: Final[dict[str, str]] = {
+    "q": ORCID_SEARCH_QUERY,
+    "start": "0",
+    "rows": "1",
+}
+ORCID_WORKS_URL = "https://orcid.org/{orcid_id}/worksExtendedPage.json"
+ORCID_WORKS_QUERYSTRING: Final[dict[str, str]] = {
+    "offset": "0",
+    "sort": "date",
+    "sortAsc": "false",
+    "pageSize": "75",
+}
+
+ObtainMethod = Callable[[Any, str], list[WebScrapeResult]]
+
+
+def cached_by_query(obtain: ObtainMethod) -> ObtainMethod:
+    """
+    Decorator that stores the results of a web scraper's `obtain` on disk,
+    one pickle per search term, in the scraper's `cache_dir`, so that
+    looking up the same paper or author again skips the network entirely.
+    Results are reused for the configured `cache_expiry_days`, after which
+    they are looked up afresh.
+
+    Lookups that found nothing are not stored, unless the server answered
+    with a 404. That answer is remembered for NOT_FOUND_TTL seconds,
+    in a separate ".miss" file, so a known miss isn't requested again
+    until it has had the chance to appear.
+    """
+
+    @wraps(obtain)
+    def wrapper(self: Any, search_text: str) -> list[WebScrapeResult]:
+        if not self.cache_dir:
+            return obtain_unless_not_found(self, search_text) or []
+        key = "|".join(
+            (RESULT_CACHE_VERSION, type(self).__name__, self.url, search_text)
+        )
+        filename = hashlib.sha256(key.encode(UTF)).hexdigest()
+        cache_file = Path(self.cache_dir) / f"{filename}.pickle"
+        miss_file = cache_file.with_suffix(".miss")
+        cached: list[WebScrapeResult] | None = read_cached_result(
+            cache_file, max_age=get_config().cache_expiry_days * DAY
+        )
+        if cached is not None:
+            return cached
+        if read_cached_result(miss_file, max_age=NOT_FOUND_TTL) is not None:
+            return []
+        results = obtain_unless_not_found(self, search_text)
+        if results is None:
+            write_cached_result(miss_file, [])
+            return []
+        if results:
+            write_cached_result(cache_file, results)
+        return results
+
+    def obtain_unless_not_found(
+        self: Any, search_text: str
+    ) -> list[WebScrapeResult] | None:
+        """Returns None, rather than no results, if the server found
+        nothing for `search_text`."""
+        try:
+            return obtain(self, search_text)
+        except NotFoundError:
+            logger.warning("No results found for query: %s", search_text)
+            return None
+
+    return wrapper
+
+
 def get_item(
     data: dict[str, Any],
     key: str,
     subkey: Optional[str | int] = None,
 ) -> Any:
-    """Retrieves an item from the parsed data, with optional subkey."""
-    try:
-        if not subkey:
-            return data[key]
-        return data[key][subkey]
-    except KeyError:
-        logger.warning(f"Key '{key}' not found in response data")
+    """
+    Retrieves an item from the parsed data, with optional subkey.
+    Returns None if either the key or the subkey is missing.
+    """
+    if key not in data:
+        logger.warning("Key '%s' not found in response data", key)
+        return None
+    value = data[key]
+    if subkey is None:
+        return value
+    if isinstance(value, Mapping):
+        if subkey in value:
+            return value[subkey]
+    elif (
+        isinstance(subkey, int)
+        and isinstance(value, Sequence)
+        and -len(value) <= subkey < len(value)
+    ):
+        return value[subkey]
+    logger.warning(
+        "Subkey '%s' not found under key '%s' in response data", subkey, key
+    )
+    return None
 
 
 @dataclass
 class SemanticWebScraper:
     url: str
+    cache_dir: FilePath | None = None
 
+    @cached_by_query
     def obtain(
         self,
         search_text: str,
-    ) -> Generator[WebScrapeResult, None, None]:
+    ) -> list[WebScrapeResult]:
         """
         Fetches and parses articles from Semantic Scholar based on the search_text.
         """
         url = self.format_request(search_text)
         response = make_request(url)
-        return self.process_response(search_text, response)
+        return list(self.process_response(search_text, response))
 
     def process_response(
         self, search_text: str, response: Response
     ) -> Generator[WebScrapeResult, None, None]:
         try:
 
-            data = loads(response.text)
+            data = _json.loads(response.content)
 
-            if not data["data"]:
-                raise ValueError("Data not found.")
+            if not (papers := get_item(data, "data")):
+                logger.warning("No results found for query: %s", search_text)
+                return
 
-            paper_data = get_item(data, "data")[0]
-            citation_titles: list[str] = [
-                citation["title"]
-                for citation in paper_data.get("citations", [])
-            ]
-            reference_titles: list[str] = [
-                reference["title"]
-                for reference in paper_data.get("references", [])
-            ]
+            paper_data = papers[0]
+            citation_titles: list[str] = list(
+                map(get_title, paper_data.get("citations", []))
+            )
+            reference_titles: list[str] = list(
+                map(get_title, paper_data.get("references", []))
+            )
 
             result = WebScrapeResult(
                 title=paper_data.get("title", "N/A"),
@@ -104,7 +275,7 @@ class SemanticWebScraper:
 
             yield result
 
-        except json.JSONDecodeError:
+        except _json.JSONDecodeError:
             logger.error(
                 "Failed to parse JSON response for query: %s", search_text
             )
@@ -115,12 +286,15 @@ class SemanticWebScraper:
                 str(e),
             )
 
-    def format_request(self, search_text: str) -> str:
-        fields: str = (
-            "url,paperId,year,authors,externalIds,title,publicationDate,abstract,citationCount,journal,fieldsOfStudy,citations,references"
+    @cached_property
+    def match_url(self) -> str:
+        """The search/match endpoint, filled in up to the query itself."""
+        return (
+            f"{self.url}search/match?fields={SEMANTIC_SCHOLAR_FIELDS}&query="
         )
-        url = f"{self.url}search/match?query={search_text}&fields={fields}"
-        return url
+
+    def format_request(self, search_text: str) -> str:
+        return self.match_url + quote_plus(search_text)
 
     def get_authors(self, paper_data: dict) -> list[str]:
         """
@@ -140,27 +314,22 @@ class ORCHIDScraper:
             "es": "http://www.orcid.org/ns/expanded-search"
         }
     )
+    cache_dir: FilePath | None = None
 
-    def obtain(self, search_terms) -> Generator[WebScrapeResult, None, None]:
+    @cached_by_query
+    def obtain(self, search_terms) -> list[WebScrapeResult]:
         full_url = self.format_request(search_terms)
         response = make_request(full_url)
         orcid_id = self.parse_xml_response(response.text)
         extended_response = self.get_extended_response(orcid_id)
-        yield from self.parse_orcid_json(extended_response)
-
-    def get_extended_response(self, orcid_id: str) -> str:
-        extended_page_querystring = {
-            "offset": "0",
-            "sort": "date",
-            "sortAsc": "false",
-            "pageSize": "75",
-        }
-        extended_url = f"https://orcid.org/{orcid_id}/worksExtendedPage.json"
+        return list(self.parse_orcid_json(extended_response))
+
+    def get_extended_response(self, orcid_id: str) -> bytes:
         extended_response = make_request(
-            extended_url,
-            params=extended_page_querystring,
+            ORCID_WORKS_URL.format(orcid_id=orcid_id),
+            params=ORCID_WORKS_QUERYSTRING,
         )
-        return extended_response.text
+        return extended_response.content
 
     def parse_xml_response(self, response_text: str) -> str:
         root = ET.fromstring(response_text).find(
@@ -169,19 +338,16 @@ class ORCHIDScraper:
         return root.find("es:orcid-id", self.namespace).text  # type: ignore
 
     def format_request(self, search_terms: str) -> str:
-        querystring = {
-            "q": '{!edismax qf="given-and-family-names^50.0 family-name^10.0 given-names^10.0 credit-name^10.0 other-names^5.0 text^1.0" pf="given-and-family-names^50.0" bq="current-institution-affiliation-name:[* TO *]^100.0 past-institution-affiliation-name:[* TO *]^70" mm=1}'
-            + search_terms,
-            "start": "0",
-            "rows": "1",
+        querystring = ORCID_SEARCH_QUERYSTRING | {
+            "q": ORCID_SEARCH_QUERY + search_terms
         }
         encoded_params = urlencode(querystring, quote_via=quote_plus)
         return f"{self.url}?{encoded_params}"
 
     def parse_orcid_json(
-        self, json_data: str
+        self, json_data: str | bytes
     ) -> Generator[WebScrapeResult, None, None]:
-        data = loads(json_data)
+        data = _json.loads(json_data)
 
         for group in data["groups"]:
             yield from self.process_response(group)
@@ -4,7 +4,7 @@ import pandas as pd
 import pytest
 import requests
 
-from src.config import config
+from src.config import get_config
 from src.docscraper import DocScraper
 from src.downloaders import BulkPDFScraper
 from src.downloaders import ImagesDownloader
@@ -89,12 +89,12 @@ def result_data_as_class():
 
 @pytest.fixture()
 def docscraper_summary():
-    return DocScraper(config.target_words, config.bycatch_words, False)
+    return DocScraper(get_config().target_words, get_config().bycatch_words, False)
 
 
 @pytest.fixture()
 def docscraper_pdf():
-    return DocScraper(config.target_words, config.bycatch_words, True)
+    return DocScraper(get_config().target_words, get_config().bycatch_words, True)
 
 
 @pytest.fixture()
@@ -115,7 +115,7 @@ def faulty_scraper():
 @pytest.fixture()
 def mock_bulkpdfscraper(mock_dirs):
     return BulkPDFScraper(
-        config.downloader_url,
+        get_config().downloader_url,
         sleep_val=0.5,
         export_dir=mock_dirs,
     )
@@ -123,7 +123,7 @@ def mock_bulkpdfscraper(mock_dirs):
 
 @pytest.fixture()
 def img_downloader():
-    return ImagesDownloader(config.downloader_url, sleep_val=0.5)
+    return ImagesDownloader(get_config().downloader_url, sleep_val=0.5)
 
 
 # will override the requests.Response returned from requests.get
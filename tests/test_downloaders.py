@@ -7,12 +7,12 @@ from unittest import mock
 
 import pytest
 
-from src.config import config
+from src.config import get_config
 from src.downloaders import BulkPDFScraper, DownloadReceipt, ImagesDownloader
 
 
 def test_downloader_config(mock_bulkpdfscraper: BulkPDFScraper):
-    assert mock_bulkpdfscraper.url == config.downloader_url
+    assert mock_bulkpdfscraper.url == get_config().downloader_url
     assert path.exists(mock_bulkpdfscraper.export_dir)
     assert isinstance(mock_bulkpdfscraper.link_cleaning_pattern, re.Pattern)
 
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import logging
+import shutil
+import warnings
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import sleep
 from typing import Literal
 from unittest import mock
 
@@ -10,15 +15,21 @@ import pandas as pd
 import pytest
 
 from src.change_dir import change_dir
+from src.config import get_config
 from src.docscraper import DocScraper
-from src.downloaders import Downloader
+from src.downloaders import BulkPDFScraper
+from src.downloaders import ImagesDownloader
 from src.factories import SCISCRAPERS
 from src.factories import read_factory
 from src.fetch import SciScraper
 from src.fetch import ScrapeFetcher
 from src.fetch import StagingFetcher
+from src.fetch import results_to_dataframe
 from src.log import logger
-from src.webscrapers import WebScraper
+from src.scraperesults import DocumentResult
+from src.scraperesults import WebScrapeResult
+from src.webscrapers import ORCHIDScraper
+from src.webscrapers import SemanticWebScraper
 
 
 @pytest.mark.parametrize(("key"), (("wordscore", "citations")))
@@ -31,7 +42,12 @@ def test_read_factory_input(
     assert isinstance(output.stager, StagingFetcher)
     assert isinstance(output.scraper, ScrapeFetcher)
     assert isinstance(
-        output.scraper.scraper, DocScraper | WebScraper | Downloader
+        output.scraper.scraper,
+        DocScraper
+        | SemanticWebScraper
+        | ORCHIDScraper
+        | BulkPDFScraper
+        | ImagesDownloader,
     )
 
 
@@ -147,6 +163,7 @@ def test_set_logging():
 def test_fetch_with_staged_reference_tuple_of_lists():
     staged_terms = (["citation"], [])
     scraper = mock.Mock()
+    scraper.obtain.return_value = [WebScrapeResult()]
     df = StagingFetcher(scraper, stager=None).fetch_with_staged_reference(staged_terms)  # type: ignore
     assert not df.empty
 
@@ -156,3 +173,116 @@ def test_fetch_with_staged_reference_empty_tuple():
     scraper = mock.Mock()
     df = StagingFetcher(scraper, stager=None).fetch_with_staged_reference(staged_terms)  # type: ignore
     assert df.empty
+
+
+class ReversedDelayScraper:
+    """Answers later search terms sooner, so any reordering would show."""
+
+    def obtain(self, search_text: str):
+        sleep(0.02 * (5 - int(search_text)))
+        yield WebScrapeResult(title=search_text)
+
+
+def test_thread_pool_results_keep_search_order():
+    fetcher = ScrapeFetcher(ReversedDelayScraper(), None, max_workers=4)  # type: ignore[arg-type]
+    assert fetcher.runs_in_threads
+    titles = [result.title for result in fetcher.fetch(list("012345"))]
+    assert titles == list("012345")
+
+
+def test_process_pool_results_keep_search_order(tmp_path: Path, test_pdf):
+    pdfs = []
+    for i in range(4):
+        pdfs.append(str(tmp_path / f"{i}.pdf"))
+        shutil.copy(test_pdf, pdfs[-1])
+    scraper = DocScraper("words/target_words.txt", "words/bycatch_words.txt")
+    fetcher = ScrapeFetcher(scraper, None, max_workers=2)  # type: ignore[arg-type]
+    assert fetcher.runs_in_processes
+    with mock.patch.object(
+        DocScraper, "extract_text_from_pdf", return_value="a short text"
+    ), mock.patch(
+        "src.docscraper.doi_from_pdf",
+        side_effect=lambda path, _: mock.Mock(identifier=Path(path).stem),
+    ):
+        results = list(fetcher.fetch(pdfs))
+    assert [result.doi_from_pdf for result in results] == ["0", "1", "2", "3"]
+
+
+def test_process_pool_defaults_to_configured_workers(test_pdf):
+    scraper = DocScraper("words/target_words.txt", "words/bycatch_words.txt")
+    fetcher = ScrapeFetcher(scraper, None)  # type: ignore[arg-type]
+    with mock.patch(
+        "src.fetch.ProcessPoolExecutor", side_effect=ThreadPoolExecutor
+    ) as pool, mock.patch.object(
+        DocScraper, "extract_text_from_pdf", return_value="a short text"
+    ), mock.patch("src.docscraper.doi_from_pdf"):
+        list(fetcher.fetch([test_pdf]))
+    assert pool.call_args.kwargs["max_workers"] == get_config().max_workers
+
+
+def test_cached_pdfs_not_prefetched(tmp_path: Path, test_pdf):
+    pdf = str(tmp_path / "paper.pdf")
+    shutil.copy(test_pdf, pdf)
+    scraper = DocScraper(
+        "words/target_words.txt",
+        "words/bycatch_words.txt",
+        cache_dir=tmp_path / "cache",
+    )
+    fetcher = ScrapeFetcher(scraper, None)  # type: ignore[arg-type]
+    assert fetcher.needs_prefetch(pdf)
+    cache_file = scraper.cache_file(pdf)
+    assert cache_file is not None
+    cache_file.parent.mkdir()
+    cache_file.touch()
+    assert not fetcher.needs_prefetch(pdf)
+    assert fetcher.needs_prefetch(str(tmp_path / "missing.pdf"))
+
+
+def test_results_to_dataframe_dtypes():
+    dataframe = results_to_dataframe(
+        iter(
+            [
+                DocumentResult("10.1/a", 40000, 2, 100000, 1.5),
+                DocumentResult("10.1/b", 3, 4, 50, 0.25),
+            ]
+        )
+    )
+    assert list(dataframe.columns) == [
+        "doi_from_pdf",
+        "matching_terms",
+        "bycatch_terms",
+        "total_word_count",
+        "wordscore",
+        "target_terms_top_3",
+        "bycatch_terms_top_3",
+        "paper_parentheticals",
+    ]
+    assert dataframe["doi_from_pdf"].dtype == "string"
+    assert dataframe["matching_terms"].dtype == "Int32"
+    assert dataframe["total_word_count"].dtype == "Int32"
+    assert dataframe["wordscore"].dtype == "Float32"
+    assert dataframe["matching_terms"].tolist() == [40000, 3]
+
+
+def test_results_to_dataframe_empty():
+    assert results_to_dataframe(iter([])).empty
+
+
+def test_remove_empty_columns_then_casting():
+    dataframe = pd.DataFrame(
+        {
+            "title": ["A", "B"],
+            "pub_date": ["2020-01-01", ""],
+            "abstract": ["", None],
+            "matching_terms": [1, 2],
+        }
+    )
+    sciscraper = SciScraper(mock.Mock(), None)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        trimmed = sciscraper.remove_empty_columns(dataframe)
+        cast = SciScraper.dataframe_casting(trimmed)
+    assert list(cast.columns) == ["title", "pub_date", "matching_terms"]
+    assert cast["pub_date"].dtype == "datetime64[ns]"
+    assert cast["matching_terms"].dtype == "Int32"
+    assert dataframe["pub_date"].tolist() == ["2020-01-01", ""]
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from unittest import mock
+
+import pytest
+
+from src.webscrapers import NotFoundError
+from src.webscrapers import RateLimiter
+from src.webscrapers import get_item
+from src.webscrapers import make_request
+
+
+def test_rate_limiter_spaces_out_threads():
+    limiter = RateLimiter()
+    start = monotonic()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: limiter.wait(0.05), range(4)))
+    assert monotonic() - start >= 0.15
+
+
+def test_rate_limiter_skips_elapsed_interval():
+    limiter = RateLimiter()
+    limiter.wait(0.05)
+    limiter.next_slot = monotonic()
+    start = monotonic()
+    limiter.wait(0.05)
+    assert monotonic() - start < 0.05
+
+
+@pytest.mark.parametrize(
+    ("status_code", "error"), ((404, NotFoundError), (500, ValueError))
+)
+def test_make_request_raises_on_error_status(status_code, error):
+    with mock.patch("src.webscrapers.client") as client:
+        client.request.return_value = mock.Mock(status_code=status_code)
+        with pytest.raises(error):
+            make_request("https://example.com", sleep_val=0)
+
+
+def test_make_request_returns_response():
+    with mock.patch("src.webscrapers.client") as client:
+        client.request.return_value = mock.Mock(status_code=200)
+        response = make_request("https://example.com", sleep_val=0)
+    assert response is client.request.return_value
+
+
+def test_pooled_adapter_mounted_on_first_request():
+    with mock.patch("src.webscrapers.client") as client:
+        client.request.return_value = mock.Mock(status_code=200)
+        make_request("https://example.com", sleep_val=0)
+        make_request("https://example.com", sleep_val=0)
+    mounted = [call.args[0] for call in client.mount.call_args_list]
+    assert mounted == ["https://", "http://"]
+
+
+@pytest.mark.parametrize(
+    ("key", "subkey", "expected"),
+    (
+        ("a", None, {"x": None}),
+        ("a", "x", None),
+        ("a", "y", None),
+        ("b", 1, 2),
+        ("b", 5, None),
+        ("c", None, None),
+    ),
+)
+def test_get_item_returns_none_when_missing(key, subkey, expected):
+    data = {"a": {"x": None}, "b": [1, 2]}
+    assert get_item(data, key, subkey) == expected
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+
+from pathlib import Path
+from unittest import mock
+
+from src.resultcache import read_cached_result
+from src.resultcache import write_cached_result
+
+
+def test_cached_result_roundtrip(tmp_path: Path):
+    cache_file = tmp_path / "nested" / "entry.pickle"
+    write_cached_result(cache_file, ["result"])
+    assert read_cached_result(cache_file) == ["result"]
+    assert read_cached_result(tmp_path / "missing.pickle") is None
+
+
+def test_cached_result_expires(tmp_path: Path):
+    cache_file = tmp_path / "entry.pickle"
+    write_cached_result(cache_file, ["result"])
+    os.utime(cache_file, (0, 0))
+    assert read_cached_result(cache_file) == ["result"]
+    assert read_cached_result(cache_file, max_age=60) is None
+
+
+def test_unreadable_cached_result_ignored(tmp_path: Path):
+    cache_file = tmp_path / "entry.pickle"
+    cache_file.write_bytes(b"not a pickle")
+    assert read_cached_result(cache_file) is None
+
+
+def test_cached_result_of_moved_class_ignored(tmp_path: Path):
+    cache_file = tmp_path / "entry.pickle"
+    cache_file.write_bytes(b"cno_such_module\nMovedResult\n.")
+    assert read_cached_result(cache_file) is None
+
+
+def test_failed_cache_write_skipped(tmp_path: Path):
+    (tmp_path / "blocked").write_bytes(b"")
+    cache_file = tmp_path / "blocked" / "entry.pickle"
+    write_cached_result(cache_file, ["result"])
+    assert read_cached_result(cache_file) is None
+    target_dir = tmp_path / "target"
+    target_dir.mkdir()
+    with mock.patch("os.replace", side_effect=PermissionError):
+        write_cached_result(target_dir / "entry.pickle", ["result"])
+    assert list(target_dir.iterdir()) == []
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+import os
+
+from pathlib import Path
+from unittest import mock
+
+from src.webscrapers import NotFoundError
+from src.webscrapers import SemanticWebScraper
+
+
+SEMANTIC_URL = "https://api.semanticscholar.org/graph/v1/paper/"
+
+
+def paper_response(title: str) -> mock.Mock:
+    return mock.Mock(
+        status_code=200,
+        content=json.dumps({"data": [{"title": title}]}).encode(),
+    )
+
+
+def test_semantic_results_cached_on_disk(tmp_path: Path):
+    scraper = SemanticWebScraper(SEMANTIC_URL, cache_dir=tmp_path)
+    with mock.patch(
+        "src.webscrapers.make_request", return_value=paper_response("Paper")
+    ) as request:
+        first = scraper.obtain("10.1234/test")
+        second = scraper.obtain("10.1234/test")
+    assert request.call_count == 1
+    assert first == second
+    assert first[0].title == "Paper"
+
+
+def test_stale_semantic_results_looked_up_again(tmp_path: Path):
+    scraper = SemanticWebScraper(SEMANTIC_URL, cache_dir=tmp_path)
+    with mock.patch(
+        "src.webscrapers.make_request", return_value=paper_response("Paper")
+    ) as request:
+        scraper.obtain("10.1234/test")
+        for cache_file in tmp_path.iterdir():
+            os.utime(cache_file, (0, 0))
+        scraper.obtain("10.1234/test")
+    assert request.call_count == 2
+
+
+def test_malformed_response_not_cached(tmp_path: Path):
+    scraper = SemanticWebScraper(SEMANTIC_URL, cache_dir=tmp_path)
+    with mock.patch(
+        "src.webscrapers.make_request",
+        side_effect=[
+            mock.Mock(status_code=200, content=b"<html>"),
+            paper_response("Paper"),
+        ],
+    ) as request:
+        assert scraper.obtain("Some Paper") == []
+        assert scraper.obtain("Some Paper")[0].title == "Paper"
+    assert request.call_count == 2
+
+
+def test_not_found_lookups_cached_until_expiry(tmp_path: Path):
+    scraper = SemanticWebScraper(SEMANTIC_URL, cache_dir=tmp_path)
+    with mock.patch(
+        "src.webscrapers.make_request", side_effect=NotFoundError
+    ) as request:
+        assert scraper.obtain("Unknown Paper") == []
+        assert scraper.obtain("Unknown Paper") == []
+        assert request.call_count == 1
+        for miss_file in tmp_path.glob("*.miss"):
+            os.utime(miss_file, (0, 0))
+        assert scraper.obtain("Unknown Paper") == []
+    assert request.call_count == 2
+
+
+def test_uncached_scraper_treats_not_found_as_empty():
+    scraper = SemanticWebScraper(SEMANTIC_URL)
+    with mock.patch(
+        "src.webscrapers.make_request", side_effect=NotFoundError
+    ):
+        assert scraper.obtain("Unknown Paper") == []
@@ -169,7 +169,7 @@ def test_semantic_scraper_obtain(
     mock_response = Mock()
     mock_response.ok = status_code == 200
     mock_response.status_code = status_code
-    mock_response.text = json.dumps(json_data)
+    mock_response.content = json.dumps(json_data).encode()
     mock_client.get.return_value = mock_response
 
     result = list(semantic_scraper.obtain(search_text) or [])
@@ -250,11 +250,11 @@ def test_orchid_scraper_parse_xml_response(
 def test_orchid_scraper_get_extended_response(orchid_scraper, mock_client):
     mock_response = Mock()
     mock_response.ok = True
-    mock_response.text = '{"test": "data"}'
+    mock_response.content = b'{"test": "data"}'
     mock_client.get.return_value = mock_response
 
     result = orchid_scraper.get_extended_response("0000-0001-2345-6789")
-    assert result == '{"test": "data"}'
+    assert result == b'{"test": "data"}'
 
 
 @pytest.mark.skip
@@ -369,7 +369,7 @@ def test_orchid_scraper_parse_single_orcid_entry_missing_data(orchid_scraper):
                 ),
                 Mock(
                     ok=True,
-                    text='{"groups": [{"works": [{"title": {"value": "Test Paper"}, "publicationDate": {"year": "2023"}, "workExternalIdentifiers": [{"externalIdentifierType": {"value": "doi"}, "externalIdentifierId": {"value": "10.1234/test"}}], "putCode": {"value": "TEST123"}, "journalTitle": {"value": "Test Journal"}, "contributorsGroupedByOrcid": [{"creditName": {"content": "John Doe"}}]}]}]}',
+                    content=b'{"groups": [{"works": [{"title": {"value": "Test Paper"}, "publicationDate": {"year": "2023"}, "workExternalIdentifiers": [{"externalIdentifierType": {"value": "doi"}, "externalIdentifierId": {"value": "10.1234/test"}}], "putCode": {"value": "TEST123"}, "journalTitle": {"value": "Test Journal"}, "contributorsGroupedByOrcid": [{"creditName": {"content": "John Doe"}}]}]}]}',
                 ),
             ],
             1,
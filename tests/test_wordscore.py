@@ -1,6 +1,13 @@
+import pickle
+
+from unittest import mock
+
 import pytest
 
+from src.docscraper import DocScraper
 from src.docscraper import calculate_likelihood
+from src.docscraper import match_terms
+from src.scraperesults import DOIFromPDFResult
 
 
 @pytest.mark.parametrize(
@@ -39,3 +46,109 @@ def test_calculate_likelihood_with_all_undesired_matches():
 
 def test_calculate_likelihood_with_large_input():
     assert calculate_likelihood(10000, 5000, 2500) >= 0
+
+
+def test_docscraper_reads_wordlists_once(docscraper_summary: DocScraper):
+    with mock.patch.object(
+        DocScraper,
+        "unpack_txt_files",
+        wraps=docscraper_summary.unpack_txt_files,
+    ) as mock_unpack:
+        docscraper_summary.obtain("nudge choice architecture")
+        docscraper_summary.obtain("behavioral design")
+    assert mock_unpack.call_count == 2
+    assert isinstance(docscraper_summary.target_set, frozenset)
+
+
+def test_loaded_wordlists_survive_pickling(docscraper_summary: DocScraper):
+    docscraper_summary.load_wordlists()
+    with mock.patch.object(DocScraper, "unpack_txt_files") as mock_unpack:
+        copy = pickle.loads(pickle.dumps(docscraper_summary))
+        assert copy.target_set == docscraper_summary.target_set
+        assert copy.bycatch_set == docscraper_summary.bycatch_set
+    mock_unpack.assert_not_called()
+
+
+def test_format_manuscript_strips_punctuation(docscraper_summary: DocScraper):
+    preprint = "Nudges, in\nChoice-Architecture (n=42) -- café_bar."
+    assert docscraper_summary.format_manuscript(preprint) == [
+        "nudges",
+        "in",
+        "choice-architecture",
+        "n",
+        "42",
+        "café",
+        "bar",
+    ]
+
+
+def test_match_terms_counts_top_three():
+    word_list = ["a", "a", "b", "c", "d", "d", "d", "d", "c", "a"]
+    word_list += ["f", "f", "f", "g", "d", "h"]
+    output = match_terms(word_list, {"a", "b", "f", "h"})
+    assert output.frequency_dist == [("a", 3), ("f", 3), ("b", 1)]
+    assert output.term_count == 7
+
+
+def test_docscraper_caches_pdf_results(tmp_path, docscraper_pdf: DocScraper):
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    docscraper_pdf.cache_dir = tmp_path / "cache"
+    with (
+        mock.patch.object(
+            DocScraper, "extract_text_from_pdf", return_value="nudge design"
+        ) as mock_extract,
+        mock.patch(
+            "src.docscraper.doi_from_pdf",
+            return_value=DOIFromPDFResult("10.1000/12345"),
+        ),
+    ):
+        [first] = docscraper_pdf.obtain(str(pdf))
+        [second] = docscraper_pdf.obtain(str(pdf))
+        pdf.write_bytes(b"%PDF-1.4 edited")
+        docscraper_pdf.obtain(str(pdf))
+    assert first == second
+    assert first.doi_from_pdf == "10.1000/12345"
+    assert mock_extract.call_count == 2
+
+
+def test_unpack_txt_files_skips_blank_lines(
+    tmp_path, docscraper_summary: DocScraper
+):
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text("Nudge\n\n  Choice  \r\n\n", encoding="utf-8")
+    assert docscraper_summary.unpack_txt_files(wordlist) == {"nudge", "choice"}
+
+
+def test_unpack_txt_files_tokenizes_entries(
+    tmp_path, docscraper_summary: DocScraper, caplog: pytest.LogCaptureFixture
+):
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text(
+        "Well-Being\nCOVID-19\nCafé\npublic health\n", encoding="utf-8"
+    )
+    words = docscraper_summary.unpack_txt_files(wordlist)
+    assert words == {"well-being", "covid-19", "café"}
+    assert "public health" in caplog.text
+    text = docscraper_summary.format_manuscript(
+        "Well-being after COVID-19, at the café."
+    )
+    assert match_terms(text, words).term_count == 3
+
+
+def test_docscraper_rejects_unknown_pdf_backend():
+    with pytest.raises(ValueError):
+        DocScraper("target.txt", "bycatch.txt", pdf_backend="pypdf")
+
+
+def test_pymupdf_backend_extracts_same_words(test_pdf: str):
+    pytest.importorskip("pymupdf")
+    plumber = DocScraper("target.txt", "bycatch.txt")
+    mupdf = DocScraper("target.txt", "bycatch.txt", pdf_backend="pymupdf")
+    plumber_words = set(
+        plumber.format_manuscript(plumber.extract_text_from_pdf(test_pdf))
+    )
+    mupdf_words = set(
+        mupdf.format_manuscript(mupdf.extract_text_from_pdf(test_pdf))
+    )
+    assert len(plumber_words & mupdf_words) / len(plumber_words) > 0.9